@@ -310,23 +310,25 @@ test_endpoint() {
 # ====================
 
 # Wait for service to be ready
+# Polls with exponential backoff from 25ms up to max_interval_ms
 wait_for_service() {
     local url="$1"
     local timeout="${2:-30}"
-    local interval="${3:-2}"
+    local max_interval_ms="${3:-500}"
     
     log "Waiting for service at $url..."
     
-    local elapsed=0
-    while [[ $elapsed -lt $timeout ]]; do
+    local start=$SECONDS
+    local delay_ms=25
+    while (( SECONDS - start <= timeout )); do
         if curl -f -s "$url" &> /dev/null; then
             success "Service is ready"
             return 0
         fi
         
         echo -n "."
-        sleep "$interval"
-        elapsed=$((elapsed + interval))
+        sleep "$(printf '%d.%03d' $((delay_ms / 1000)) $((delay_ms % 1000)))"
+        delay_ms=$(( delay_ms * 2 > max_interval_ms ? max_interval_ms : delay_ms * 2 ))
     done
     
     echo ""
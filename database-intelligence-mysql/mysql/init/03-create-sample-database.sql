@@ -83,17 +83,29 @@ DELIMITER //
 CREATE PROCEDURE generate_orders(IN num_orders INT)
 BEGIN
     DECLARE i INT DEFAULT 0;
-    DECLARE customer_id INT;
-    DECLARE product_id INT;
-    DECLARE quantity INT;
-    DECLARE price DECIMAL(10, 2);
+    DECLARE v_customer_id INT;
+    DECLARE v_product_id INT;
+    DECLARE v_quantity INT;
+    DECLARE v_price DECIMAL(10, 2);
+    DECLARE min_customer_id INT;
+    DECLARE max_customer_id INT;
+    DECLARE min_product_id INT;
+    DECLARE max_product_id INT;
+    DECLARE target_id INT;
+    
+    -- Pick random rows by seeking into the primary key range rather than
+    -- sorting the whole table with ORDER BY RAND() on every iteration
+    SELECT MIN(customer_id), MAX(customer_id) INTO min_customer_id, max_customer_id FROM customers;
+    SELECT MIN(product_id), MAX(product_id) INTO min_product_id, max_product_id FROM products;
     
     WHILE i < num_orders DO
         -- Random customer
-        SELECT customer_id INTO customer_id FROM customers ORDER BY RAND() LIMIT 1;
+        SET target_id = FLOOR(min_customer_id + RAND() * (max_customer_id - min_customer_id + 1));
+        SELECT customer_id INTO v_customer_id FROM customers
+        WHERE customer_id >= target_id ORDER BY customer_id LIMIT 1;
         
         -- Create order
-        INSERT INTO orders (customer_id, total_amount) VALUES (customer_id, 0);
+        INSERT INTO orders (customer_id, total_amount) VALUES (v_customer_id, 0);
         SET @order_id = LAST_INSERT_ID();
         
         -- Add 1-5 random items
@@ -102,13 +114,15 @@ BEGIN
         SET @total = 0;
         
         WHILE @j < @items DO
-            SELECT product_id, price INTO product_id, price FROM products ORDER BY RAND() LIMIT 1;
-            SET quantity = FLOOR(1 + RAND() * 5);
+            SET target_id = FLOOR(min_product_id + RAND() * (max_product_id - min_product_id + 1));
+            SELECT product_id, price INTO v_product_id, v_price FROM products
+            WHERE product_id >= target_id ORDER BY product_id LIMIT 1;
+            SET v_quantity = FLOOR(1 + RAND() * 5);
             
             INSERT INTO order_items (order_id, product_id, quantity, unit_price) 
-            VALUES (@order_id, product_id, quantity, price);
+            VALUES (@order_id, v_product_id, v_quantity, v_price);
             
-            SET @total = @total + (quantity * price);
+            SET @total = @total + (v_quantity * v_price);
             SET @j = @j + 1;
         END WHILE;
         
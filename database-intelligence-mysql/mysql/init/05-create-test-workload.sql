@@ -62,6 +62,18 @@ BEGIN
     DECLARE i INT DEFAULT 0;
     DECLARE j INT DEFAULT 0;
     
+    -- The audit_log sequence below recurses 10000 levels deep
+    SET @saved_cte_max_recursion_depth = @@SESSION.cte_max_recursion_depth;
+    SET SESSION cte_max_recursion_depth = 10000;
+    
+    -- Skip per-row foreign key lookups during the bulk load; the generated
+    -- rows only reference parents inserted by this procedure
+    SET @saved_foreign_key_checks = @@SESSION.foreign_key_checks;
+    SET SESSION foreign_key_checks = 0;
+    
+    -- Load everything in one transaction instead of committing per row
+    START TRANSACTION;
+    
     -- Generate customers and orders
     WHILE i < 1000 DO
         -- Insert order
@@ -97,42 +109,50 @@ BEGIN
         SET i = i + 1;
     END WHILE;
     
-    -- Generate inventory
-    SET i = 1;
-    WHILE i <= 50 DO
-        INSERT INTO inventory (product_id, product_name, quantity_available, reserved_quantity)
-        VALUES (i, CONCAT('Product ', i), FLOOR(RAND() * 1000), 0);
-        SET i = i + 1;
-    END WHILE;
+    -- Generate inventory in a single multi-row insert
+    INSERT INTO inventory (product_id, product_name, quantity_available, reserved_quantity)
+    WITH RECURSIVE seq (n) AS (
+        SELECT 1
+        UNION ALL
+        SELECT n + 1 FROM seq WHERE n < 50
+    )
+    SELECT n, CONCAT('Product ', n), FLOOR(RAND() * 1000), 0
+    FROM seq;
     
-    -- Generate audit log entries
-    SET i = 0;
-    WHILE i < 10000 DO
-        INSERT INTO audit_log (user_id, action, object_type, object_id, details, ip_address)
-        VALUES (
-            FLOOR(1 + RAND() * 100),
-            CASE FLOOR(RAND() * 4)
-                WHEN 0 THEN 'CREATE'
-                WHEN 1 THEN 'UPDATE'
-                WHEN 2 THEN 'DELETE'
-                ELSE 'VIEW'
-            END,
-            CASE FLOOR(RAND() * 3)
-                WHEN 0 THEN 'order'
-                WHEN 1 THEN 'product'
-                ELSE 'customer'
-            END,
-            FLOOR(1 + RAND() * 1000),
-            JSON_OBJECT('timestamp', NOW(), 'source', 'test'),
-            CONCAT(
-                FLOOR(RAND() * 256), '.', 
-                FLOOR(RAND() * 256), '.', 
-                FLOOR(RAND() * 256), '.', 
-                FLOOR(RAND() * 256)
-            )
-        );
-        SET i = i + 1;
-    END WHILE;
+    -- Generate audit log entries in a single multi-row insert
+    INSERT INTO audit_log (user_id, action, object_type, object_id, details, ip_address)
+    WITH RECURSIVE seq (n) AS (
+        SELECT 1
+        UNION ALL
+        SELECT n + 1 FROM seq WHERE n < 10000
+    )
+    SELECT
+        FLOOR(1 + RAND() * 100),
+        CASE FLOOR(RAND() * 4)
+            WHEN 0 THEN 'CREATE'
+            WHEN 1 THEN 'UPDATE'
+            WHEN 2 THEN 'DELETE'
+            ELSE 'VIEW'
+        END,
+        CASE FLOOR(RAND() * 3)
+            WHEN 0 THEN 'order'
+            WHEN 1 THEN 'product'
+            ELSE 'customer'
+        END,
+        FLOOR(1 + RAND() * 1000),
+        JSON_OBJECT('timestamp', NOW(), 'source', 'test'),
+        CONCAT(
+            FLOOR(RAND() * 256), '.', 
+            FLOOR(RAND() * 256), '.', 
+            FLOOR(RAND() * 256), '.', 
+            FLOOR(RAND() * 256)
+        )
+    FROM seq;
+    
+    COMMIT;
+    
+    SET SESSION cte_max_recursion_depth = @saved_cte_max_recursion_depth;
+    SET SESSION foreign_key_checks = @saved_foreign_key_checks;
 END//
 
 -- Stored procedures to generate different wait patterns
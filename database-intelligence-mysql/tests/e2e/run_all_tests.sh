@@ -217,15 +217,16 @@ EOF
     local failed_tests=0
     
     if [ -f "$JSON_REPORT" ]; then
-        while IFS= read -r line; do
-            if echo "$line" | jq -e '.Action == "pass"' > /dev/null 2>&1; then
-                ((passed_tests++))
-                ((total_tests++))
-            elif echo "$line" | jq -e '.Action == "fail"' > /dev/null 2>&1; then
-                ((failed_tests++))
-                ((total_tests++))
-            fi
-        done < "$JSON_REPORT"
+        # Count pass/fail events in one jq pass; non-JSON lines (go build
+        # output captured via 2>&1) are skipped by fromjson?
+        while read -r count action; do
+            case "$action" in
+                pass) passed_tests=$count ;;
+                fail) failed_tests=$count ;;
+            esac
+        done < <(jq -R -r 'fromjson? | select(.Action == "pass" or .Action == "fail") | .Action' \
+                    "$JSON_REPORT" 2>/dev/null | sort | uniq -c)
+        total_tests=$((passed_tests + failed_tests))
     fi
     
     local pass_rate=0
@@ -285,12 +286,14 @@ EOF
             class="test-fail"
         fi
         
-        echo "<tr class='$class'>" >> "$REPORT_FILE"
-        echo "<td>$suite</td>" >> "$REPORT_FILE"
-        echo "<td>$status</td>" >> "$REPORT_FILE"
-        echo "<td>-</td>" >> "$REPORT_FILE"
-        echo "<td>View logs for details</td>" >> "$REPORT_FILE"
-        echo "</tr>" >> "$REPORT_FILE"
+        {
+            echo "<tr class='$class'>"
+            echo "<td>$suite</td>"
+            echo "<td>$status</td>"
+            echo "<td>-</td>"
+            echo "<td>View logs for details</td>"
+            echo "</tr>"
+        } >> "$REPORT_FILE"
     done
     
     cat >> "$REPORT_FILE" << 'EOF'
@@ -136,14 +136,16 @@ wait_for_service() {
     
     log_info "Waiting for $service_name to be ready on $host:$port..."
     
-    local count=0
+    # Poll with exponential backoff (25ms doubling up to 500ms)
+    local start=$SECONDS
+    local delay_ms=25
     while ! nc -z "$host" "$port" >/dev/null 2>&1; do
-        if [[ $count -ge $timeout ]]; then
+        if (( SECONDS - start > timeout )); then
             log_error "$service_name failed to start within ${timeout}s"
             return 1
         fi
-        sleep 1
-        ((count++))
+        sleep "$(printf '%d.%03d' $((delay_ms / 1000)) $((delay_ms % 1000)))"
+        delay_ms=$(( delay_ms * 2 > 500 ? 500 : delay_ms * 2 ))
     done
     
     log_success "$service_name is ready!"